@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import importlib.util
+
 from tutor.plugins import OfficialPlugin
 from tutor.commands.cli import main
 
@@ -16,10 +18,9 @@ for plugin_name in [
     "webui",
     "xqueue",
 ]:
-    try:
+    # Plugin modules are imported lazily: here we only check that they are available
+    if importlib.util.find_spec(f"tutor{plugin_name}") is not None:
         OfficialPlugin.load(plugin_name)
-    except ImportError:
-        pass
 
 if __name__ == "__main__":
     main()
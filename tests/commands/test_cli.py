@@ -1,7 +1,10 @@
 import unittest
+from unittest.mock import patch
 
+import click
 from click.testing import CliRunner
 
+from tutor import plugins
 from tutor.__about__ import __version__
 from tutor.commands.cli import cli, print_help
 
@@ -25,3 +28,23 @@ class CliTests(unittest.TestCase):
         self.assertEqual(0, result.exit_code)
         self.assertIsNone(result.exception)
         self.assertRegex(result.output, r"cli, version {}\n".format(__version__))
+
+    def test_cli_plugin_command(self) -> None:
+        @click.command()
+        def hello() -> None:
+            click.echo("Hello from plugin1")
+
+        class plugin1:
+            command = hello
+
+        plugins.Plugins.clear_cache()
+        with patch.object(
+            plugins.Plugins,
+            "iter_installed",
+            return_value=[plugins.BasePlugin("plugin1", plugin1)],
+        ):
+            runner = CliRunner()
+            result = runner.invoke(cli, ["plugin1"])
+        plugins.Plugins.clear_cache()
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("Hello from plugin1", result.output)
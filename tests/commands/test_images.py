@@ -11,6 +11,9 @@ from tutor.commands.images import ImageNotFoundError, images_command
 
 
 class ImagesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        plugins.Plugins.clear_cache()
+
     def test_images_help(self) -> None:
         runner = CliRunner()
         result = runner.invoke(images_command, ["--help"])
@@ -1,14 +1,21 @@
+import os
+import stat
 import unittest
 from unittest.mock import Mock, patch
 
 from click.testing import CliRunner
 
 from tests.helpers import TestContext, temporary_root
-from tutor import plugins
+from tutor import config as tutor_config
+from tutor import env as tutor_env
+from tutor import fmt, plugins
 from tutor.commands.plugins import plugins_command
 
 
 class PluginsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        plugins.Plugins.clear_cache()
+
     def test_plugins_help(self) -> None:
         runner = CliRunner()
         result = runner.invoke(plugins_command, ["--help"])
@@ -45,6 +52,49 @@ class PluginsTests(unittest.TestCase):
             self.assertEqual(1, result.exit_code)
             self.assertTrue(result.exception)
 
+    def test_plugins_install_local_plugin(self) -> None:
+        with temporary_root() as root:
+            plugin_src = os.path.join(root, "myplugin.yml")
+            with open(plugin_src, "w", encoding="utf-8") as f:
+                f.write("name: myplugin\nversion: '0.1'\n")
+            plugins_root = os.path.join(root, "plugins")
+            with patch.object(plugins.DictPlugin, "ROOT", plugins_root):
+                result = CliRunner().invoke(
+                    plugins_command, ["install", plugin_src], obj=TestContext(root)
+                )
+            self.assertEqual(0, result.exit_code)
+            self.assertIsNone(result.exception)
+            with open(
+                os.path.join(plugins_root, "myplugin.yml"), encoding="utf-8"
+            ) as f:
+                self.assertEqual("name: myplugin\nversion: '0.1'\n", f.read())
+            umask = os.umask(0)
+            os.umask(umask)
+            self.assertEqual(
+                0o666 & ~umask,
+                stat.S_IMODE(
+                    os.stat(os.path.join(plugins_root, "myplugin.yml")).st_mode
+                ),
+            )
+
+    def test_plugins_install_interrupted_download(self) -> None:
+        response = Mock()
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=None)
+        response.read.side_effect = [b"name: myplugin\n", ConnectionResetError()]
+        with temporary_root() as root:
+            plugins_root = os.path.join(root, "plugins")
+            with patch.object(plugins.DictPlugin, "ROOT", plugins_root):
+                with patch("urllib.request.urlopen", return_value=response):
+                    result = CliRunner().invoke(
+                        plugins_command,
+                        ["install", "https://example.com/myplugin.yml"],
+                        obj=TestContext(root),
+                    )
+            self.assertEqual(1, result.exit_code)
+            self.assertIsInstance(result.exception, ConnectionResetError)
+            self.assertEqual([], os.listdir(plugins_root))
+
     def test_plugins_enable_not_installed_plugin(self) -> None:
         with temporary_root() as root:
             context = TestContext(root)
@@ -62,3 +112,62 @@ class PluginsTests(unittest.TestCase):
             )
             self.assertEqual(0, result.exit_code)
             self.assertFalse(result.exception)
+
+    @patch.object(
+        plugins.Plugins,
+        "iter_installed",
+        return_value=[
+            plugins.DictPlugin({"name": "plugin1", "version": "1.0.0"}),
+            plugins.DictPlugin({"name": "plugin2", "version": "1.0.0"}),
+        ],
+    )
+    def test_plugins_disable_all(self, _iter_installed: Mock) -> None:
+        with temporary_root() as root:
+            context = TestContext(root)
+            runner = CliRunner()
+            result = runner.invoke(
+                plugins_command, ["enable", "plugin1", "plugin2"], obj=context
+            )
+            self.assertEqual(0, result.exit_code)
+            for name in ["plugin1", "plugin2"]:
+                os.makedirs(tutor_env.pathjoin(root, "plugins", name))
+            result = runner.invoke(plugins_command, ["disable", "all"], obj=context)
+            self.assertEqual(0, result.exit_code)
+            self.assertIsNone(result.exception)
+            self.assertEqual([], os.listdir(tutor_env.pathjoin(root, "plugins")))
+
+    @patch.object(plugins.DictPlugin, "iter_installed", return_value=[])
+    @patch.object(fmt, "echo_error")
+    def test_plugins_broken_entrypoint(
+        self, echo_error: Mock, _dict_plugin_iter_installed: Mock
+    ) -> None:
+        broken = Mock()
+        broken.name = "broken"
+        broken.load.side_effect = ImportError("boom")
+        ok = Mock()
+        ok.name = "ok"
+        ok.load.return_value = None
+        with patch.object(
+            plugins, "iter_entry_points", return_value=[(broken, None), (ok, None)]
+        ):
+            with temporary_root() as root:
+                context = TestContext(root)
+                runner = CliRunner()
+                result = runner.invoke(
+                    plugins_command, ["enable", "broken", "ok"], obj=context
+                )
+                self.assertEqual(0, result.exit_code)
+
+                tutor_config.get_base({"PLUGINS": ["broken", "ok"]})
+                echo_error.assert_called_once_with(
+                    "Failed to load entrypoint 'broken': boom"
+                )
+
+                result = runner.invoke(
+                    plugins_command, ["disable", "broken"], obj=context
+                )
+                self.assertEqual(0, result.exit_code)
+                self.assertIsNone(result.exception)
+                config = tutor_config.load_minimal(root)
+                self.assertTrue(plugins.is_enabled(config, "ok"))
+                self.assertFalse(plugins.is_enabled(config, "broken"))
@@ -5,6 +5,8 @@ from tutor.commands.context import BaseJobContext
 from tutor.jobs import BaseJobRunner
 from tutor.types import Config
 
+NL = os.linesep
+
 
 class TestJobRunner(BaseJobRunner):
     def __init__(self, root: str, config: Config):
@@ -17,9 +19,7 @@ class TestJobRunner(BaseJobRunner):
         super().__init__(root, config)
 
     def run_job(self, service: str, command: str) -> int:
-        print(
-            os.linesep.join(["Service: {}".format(service), "-----", command, "----- "])
-        )
+        print(f"Service: {service}{NL}-----{NL}{command}{NL}----- ")
         return 0
 
 
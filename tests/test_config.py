@@ -22,6 +22,12 @@ class ConfigTests(unittest.TestCase):
         tutor_config.merge(config1, config2)
         self.assertEqual({"x": "y"}, config1)
 
+    def test_get_template_returns_copy(self) -> None:
+        defaults1 = tutor_config.get_template("defaults.yml")
+        defaults1.clear()
+        defaults2 = tutor_config.get_template("defaults.yml")
+        self.assertIn("DOCKER_IMAGE_OPENEDX", defaults2)
+
     def test_merge_not_render(self) -> None:
         config: Config = {}
         base = tutor_config.get_base({})
@@ -1,8 +1,12 @@
+import os
+import stat
+import tempfile
 import unittest
+from typing import List
 from unittest.mock import Mock, patch
 
 from tutor import config as tutor_config
-from tutor import exceptions, fmt, plugins
+from tutor import exceptions, fmt, plugins, serialize
 from tutor.types import Config, get_typed
 
 
@@ -12,10 +16,49 @@ class PluginsTests(unittest.TestCase):
 
     @patch.object(plugins.DictPlugin, "iter_installed", return_value=[])
     def test_iter_installed(self, dict_plugin_iter_installed: Mock) -> None:
-        with patch.object(plugins.pkg_resources, "iter_entry_points", return_value=[]):  # type: ignore
+        with patch.object(plugins, "iter_entry_points", return_value=[]):
             self.assertEqual([], list(plugins.iter_installed()))
             dict_plugin_iter_installed.assert_called_once()
 
+    def test_entrypoint_plugins(self) -> None:
+        entrypoint = Mock()
+        entrypoint.name = "plugin1"
+        entrypoint.load.return_value = None
+        with patch.object(
+            plugins,
+            "iter_entry_points",
+            return_value=[(entrypoint, Mock(version="1.0.0"))],
+        ):
+            loaded = list(plugins.EntrypointPlugin.iter_load())
+        self.assertEqual(["plugin1"], [plugin.name for plugin in loaded])
+        self.assertEqual("1.0.0", loaded[0].version)
+        entrypoint.load.assert_not_called()
+        self.assertEqual({}, loaded[0].patches)
+        entrypoint.load.assert_called_once()
+
+    def test_entrypoint_plugins_are_loaded_once(self) -> None:
+        entrypoint = Mock()
+        entrypoint.name = "plugin1"
+        entrypoint.load.return_value = None
+        for _ in range(2):
+            plugins.Plugins.clear_cache()
+            plugin = plugins.EntrypointPlugin(entrypoint)
+            self.assertEqual({}, plugin.patches)
+        entrypoint.load.assert_called_once()
+
+    def test_entrypoint_plugin_load_error(self) -> None:
+        entrypoint = Mock()
+        entrypoint.name = "plugin1"
+        entrypoint.load.side_effect = ImportError("No module named 'plugin1'")
+        plugin = plugins.EntrypointPlugin(entrypoint)
+        self.assertEqual("0.0.0", plugin.version)
+        with patch.object(fmt, "echo_error") as echo_error:
+            self.assertEqual({}, plugin.config)
+            self.assertEqual({}, plugin.patches)
+        echo_error.assert_called_once_with(
+            "Failed to load entrypoint 'plugin1': No module named 'plugin1'"
+        )
+
     def test_is_installed(self) -> None:
         self.assertFalse(plugins.is_installed("dummy"))
 
@@ -36,6 +79,34 @@ class PluginsTests(unittest.TestCase):
             )
         dict_plugin_iter_installed.assert_called_once()
 
+    def test_official_plugin_is_loaded_lazily(self) -> None:
+        class module:
+            config = {"set": {"KEY": "value"}}
+
+        with patch.object(
+            plugins.importlib, "import_module", return_value=module  # type: ignore
+        ) as import_module:
+            plugin = plugins.OfficialPlugin("plugin1")
+            import_module.assert_not_called()
+            self.assertEqual({"KEY": "value"}, plugin.config_set)
+            self.assertEqual({"KEY": "value"}, plugin.config_set)
+            import_module.assert_called_once_with("tutorplugin1.plugin")
+
+    @patch.object(fmt, "echo_error")
+    def test_official_plugin_import_error(self, echo_error: Mock) -> None:
+        with patch.object(
+            plugins.importlib,  # type: ignore
+            "import_module",
+            side_effect=ModuleNotFoundError("No module named 'missing'"),
+        ):
+            plugin = plugins.OfficialPlugin("fake")
+            with patch.object(plugins.Plugins, "iter_installed", return_value=[plugin]):
+                tutor_config.get_base({"PLUGINS": ["fake"]})
+            self.assertEqual("0.0.0", plugin.version)
+        echo_error.assert_called_once_with(
+            "Failed to load plugin 'fake': No module named 'missing'"
+        )
+
     def test_enable(self) -> None:
         config: Config = {plugins.CONFIG_KEY: []}
         with patch.object(plugins, "is_installed", return_value=True):
@@ -43,6 +114,12 @@ class PluginsTests(unittest.TestCase):
             plugins.enable(config, "plugin1")
         self.assertEqual(["plugin1", "plugin2"], config[plugins.CONFIG_KEY])
 
+    def test_enable_unsorted(self) -> None:
+        config: Config = {plugins.CONFIG_KEY: ["plugin2", "plugin1"]}
+        with patch.object(plugins, "is_installed", return_value=True):
+            plugins.enable(config, "plugin3")
+        self.assertEqual(["plugin1", "plugin2", "plugin3"], config[plugins.CONFIG_KEY])
+
     def test_enable_twice(self) -> None:
         config: Config = {plugins.CONFIG_KEY: []}
         with patch.object(plugins, "is_installed", return_value=True):
@@ -102,6 +179,24 @@ class PluginsTests(unittest.TestCase):
         self.assertEqual([], config["PLUGINS"])
         self.assertNotIn("KEY", config)
 
+    @patch.object(
+        plugins.Plugins,
+        "iter_installed",
+        return_value=[
+            plugins.DictPlugin({"name": "plugin1", "version": "1.0.0"}),
+        ],
+    )
+    def test_get_enabled(self, _iter_installed_mock: Mock) -> None:
+        config: Config = {"PLUGINS": ["plugin1"]}
+        self.assertEqual("plugin1", plugins.get_enabled(config, "plugin1").name)
+        self.assertRaises(ValueError, plugins.get_enabled, config, "plugin2")
+        config["PLUGINS"] = []
+        self.assertRaises(ValueError, plugins.get_enabled, config, "plugin1")
+
+    def test_invalid_plugins(self) -> None:
+        config: Config = {plugins.CONFIG_KEY: "plugin1"}
+        self.assertRaises(exceptions.TutorError, plugins.is_enabled, config, "plugin1")
+
     def test_none_plugins(self) -> None:
         config: Config = {plugins.CONFIG_KEY: None}
         self.assertFalse(plugins.is_enabled(config, "myplugin"))
@@ -118,6 +213,41 @@ class PluginsTests(unittest.TestCase):
             patches = list(plugins.iter_patches({}, "patch1"))
         self.assertEqual([("plugin1", "Hello {{ ID }}")], patches)
 
+    def test_patches_are_loaded_lazily(self) -> None:
+        class plugin1:
+            patches = {"patch1": "Hello {{ ID }}"}
+
+        with patch.object(
+            plugins.Plugins,
+            "iter_enabled",
+            return_value=[plugins.BasePlugin("plugin1", plugin1)],
+        ) as iter_enabled:
+            plugins_obj = plugins.Plugins({})
+            iter_enabled.assert_not_called()
+            self.assertEqual([], list(plugins_obj.iter_patches("patch2")))
+            self.assertEqual([], list(plugins_obj.iter_patches("patch3")))
+            iter_enabled.assert_called_once()
+
+    def test_patches_are_indexed_once(self) -> None:
+        class plugin1:
+            patches = {"patch1": "Hello {{ ID }}"}
+
+        with patch.object(
+            plugins.Plugins,
+            "iter_enabled",
+            return_value=[plugins.BasePlugin("plugin1", plugin1)],
+        ) as iter_enabled:
+            config: Config = {"PLUGINS": ["plugin1"]}
+            for _ in range(2):
+                self.assertEqual(
+                    [("plugin1", "Hello {{ ID }}")],
+                    list(plugins.iter_patches(config, "patch1")),
+                )
+            iter_enabled.assert_called_once()
+            plugins.Plugins.clear_cache()
+            list(plugins.iter_patches(config, "patch1"))
+            self.assertEqual(2, iter_enabled.call_count)
+
     def test_plugin_without_patches(self) -> None:
         with patch.object(
             plugins.Plugins,
@@ -210,6 +340,32 @@ class PluginsTests(unittest.TestCase):
 
         self.assertEqual(10, len(value1))
 
+    def test_invalid_plugin_attributes(self) -> None:
+        invalid_attrs: List[Config] = [
+            {"config": {"add": {1: "value"}}},
+            {"config": {"add": "value"}},
+            {"patches": {"patch1": 1}},
+            {"hooks": {"init": [1]}},
+            {"hooks": {"build-image": {"image": 1}}},
+            {"hooks": {"init": "service"}},
+        ]
+        for attrs in invalid_attrs:
+            self.assertRaises(
+                exceptions.TutorError,
+                plugins.DictPlugin,
+                {"name": "plugin1", "version": "0.1", **attrs},
+            )
+
+    def test_invalid_plugin_config_errors(self) -> None:
+        with self.assertRaises(exceptions.TutorError) as context:
+            plugins.DictPlugin(
+                {"name": "plugin1", "version": "0.1", "config": {"add": "value"}}
+            )
+        self.assertIn("Expected dict, got <class 'str'>", context.exception.args[0])
+        with self.assertRaises(exceptions.TutorError) as context:
+            plugins.DictPlugin({"name": "plugin1", "version": "0.1", "config": {1: {}}})
+        self.assertIn("Expected str, got <class 'int'>", context.exception.args[0])
+
     def test_hooks(self) -> None:
         class plugin1:
             hooks = {"init": ["myclient"]}
@@ -223,6 +379,22 @@ class PluginsTests(unittest.TestCase):
                 [("plugin1", ["myclient"])], list(plugins.iter_hooks({}, "init"))
             )
 
+    def test_hooks_are_indexed_once(self) -> None:
+        class plugin1:
+            hooks = {"init": ["myclient"]}
+
+        with patch.object(
+            plugins.Plugins,
+            "iter_enabled",
+            return_value=[plugins.BasePlugin("plugin1", plugin1)],
+        ) as iter_enabled:
+            config: Config = {"PLUGINS": ["plugin1"]}
+            self.assertEqual(
+                [("plugin1", ["myclient"])], list(plugins.iter_hooks(config, "init"))
+            )
+            self.assertEqual([], list(plugins.iter_hooks(config, "pre-init")))
+            iter_enabled.assert_called_once()
+
     def test_plugins_are_updated_on_config_change(self) -> None:
         config: Config = {"PLUGINS": []}
         plugins1 = plugins.Plugins(config)
@@ -242,3 +414,83 @@ class PluginsTests(unittest.TestCase):
         )
         self.assertEqual("myplugin", plugin.name)
         self.assertEqual({"KEY": "value"}, plugin.config_set)
+
+    def test_dict_plugin_load(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            for name in ["plugin1", "plugin2"]:
+                with open(
+                    os.path.join(root, name + ".yml"), "w", encoding="utf-8"
+                ) as f:
+                    f.write(f"name: {name}\nversion: '0.1'\n")
+            with patch.object(plugins.DictPlugin, "ROOT", root):
+                loaded = sorted(
+                    plugin.name for plugin in plugins.DictPlugin.iter_load()
+                )
+        self.assertEqual(["plugin1", "plugin2"], loaded)
+
+    def test_dict_plugin_load_from_index(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "plugin1.yml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("name: plugin1\nversion: '0.1'\npatches:\n  patch1: hello\n")
+            with patch.object(plugins.DictPlugin, "ROOT", root):
+                list(plugins.DictPlugin.iter_load())
+                self.assertTrue(
+                    os.path.exists(
+                        os.path.join(root, plugins.DictPlugin.INDEX_FILENAME)
+                    )
+                )
+                with patch.object(
+                    serialize, "load", side_effect=serialize.load
+                ) as load:
+                    loaded = list(plugins.DictPlugin.iter_load())
+                    self.assertEqual(["plugin1"], [plugin.name for plugin in loaded])
+                    self.assertEqual("0.1", loaded[0].version)
+                    load.assert_not_called()
+                    self.assertEqual({"patch1": "hello"}, loaded[0].patches)
+                    load.assert_called_once()
+
+                # Modified plugins are parsed again
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("  patch2: world\n")
+                with patch.object(
+                    serialize, "load", side_effect=serialize.load
+                ) as load:
+                    loaded = list(plugins.DictPlugin.iter_load())
+                    load.assert_called_once()
+                    self.assertEqual(
+                        {"patch1": "hello", "patch2": "world"}, loaded[0].patches
+                    )
+
+    def test_dict_plugin_save_index(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            with patch.object(plugins.DictPlugin, "ROOT", root):
+                plugins.DictPlugin.save_index({})
+                umask = os.umask(0)
+                os.umask(umask)
+                index_path = os.path.join(root, plugins.DictPlugin.INDEX_FILENAME)
+                self.assertEqual(
+                    0o666 & ~umask, stat.S_IMODE(os.stat(index_path).st_mode)
+                )
+                os.remove(index_path)
+
+                # Failing to replace the index does not leave the temporary file behind
+                with patch.object(os, "replace", side_effect=PermissionError):
+                    plugins.DictPlugin.save_index({})
+                self.assertEqual([], os.listdir(root))
+
+    def test_dict_plugin_load_invalid(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, "plugin1.yml"), "w", encoding="utf-8") as f:
+                f.write("name: plugin1\n")
+            with patch.object(plugins.DictPlugin, "ROOT", root):
+                self.assertRaises(
+                    exceptions.TutorError, list, plugins.DictPlugin.iter_load()
+                )
+
+    def test_dict_plugin_load_missing_root(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            with patch.object(
+                plugins.DictPlugin, "ROOT", os.path.join(root, "missing")
+            ):
+                self.assertEqual([], list(plugins.DictPlugin.iter_load()))
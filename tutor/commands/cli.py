@@ -1,4 +1,5 @@
 import sys
+from typing import List, Optional
 
 import appdirs
 import click
@@ -11,7 +12,7 @@ from .dev import dev
 from .images import images_command
 from .k8s import k8s
 from .local import local
-from .plugins import add_plugin_commands, plugins_command
+from .plugins import add_plugin_command, add_plugin_commands, plugins_command
 
 
 def main() -> None:
@@ -23,7 +24,6 @@ def main() -> None:
         cli.add_command(k8s)
         cli.add_command(print_help)
         cli.add_command(plugins_command)
-        add_plugin_commands(cli)
         cli()  # pylint: disable=no-value-for-parameter
     except KeyboardInterrupt:
         pass
@@ -32,7 +32,24 @@ def main() -> None:
         sys.exit(1)
 
 
+class TutorCli(click.Group):
+    """
+    Commands provided by plugins are added only when they are listed or invoked, such
+    that installed plugins do not all need to be loaded on every call.
+    """
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        add_plugin_commands(self)
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands:
+            add_plugin_command(self, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 @click.group(
+    cls=TutorCli,
     context_settings={"help_option_names": ["-h", "--help", "help"]},
     help="Tutor is the Docker-based Open edX distribution designed for peace of mind.",
 )
@@ -1,5 +1,6 @@
 import os
 import shutil
+import tempfile
 import urllib.request
 from typing import List
 
@@ -58,9 +59,10 @@ def enable(context: Context, plugin_names: List[str]) -> None:
 @click.pass_obj
 def disable(context: Context, plugin_names: List[str]) -> None:
     config = tutor_config.load_minimal(context.root)
-    disable_all = "all" in plugin_names
+    plugin_name_set = set(plugin_names)
+    disable_all = "all" in plugin_name_set
     for plugin in plugins.iter_enabled(config):
-        if disable_all or plugin.name in plugin_names:
+        if disable_all or plugin.name in plugin_name_set:
             fmt.echo_info("Disabling plugin {}...".format(plugin.name))
             for key, value in plugin.config_set.items():
                 value = tutor_env.render_unknown(config, value)
@@ -112,22 +114,35 @@ def install(location: str) -> None:
         basename += ".yml"
     plugin_path = os.path.join(plugins.DictPlugin.ROOT, basename)
 
-    if location.startswith("http"):
-        # Download file
-        response = urllib.request.urlopen(location)
-        content = response.read().decode()
-    elif os.path.isfile(location):
-        # Read file
-        with open(location) as f:
-            content = f.read()
-    else:
+    is_url = location.startswith("http")
+    if not is_url and not os.path.isfile(location):
         raise exceptions.TutorError("No plugin found at {}".format(location))
 
     # Save file
     if not os.path.exists(plugins.DictPlugin.ROOT):
         os.makedirs(plugins.DictPlugin.ROOT)
-    with open(plugin_path, "w", newline="\n") as f:
-        f.write(content)
+    # Write to a temporary file first, such that an interrupted download does not leave
+    # a truncated plugin behind. Hidden files are ignored by the plugin loader.
+    with tempfile.NamedTemporaryFile(
+        dir=plugins.DictPlugin.ROOT, prefix=".", suffix=".tmp", delete=False
+    ) as f:
+        try:
+            if is_url:
+                # Download file, without loading it entirely in memory
+                with urllib.request.urlopen(location) as response:
+                    shutil.copyfileobj(response, f, length=64 * 1024)
+            else:
+                with open(location, "rb") as source:
+                    shutil.copyfileobj(source, f)
+            # Temporary files are created with 0600 permissions: apply the umask instead
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(f.name, 0o666 & ~umask)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+    os.replace(f.name, plugin_path)
     fmt.echo_info("Plugin installed at {}".format(plugin_path))
 
 
@@ -137,9 +152,18 @@ def add_plugin_commands(command_group: click.Group) -> None:
     added with a name that is equal to the plugin name.
     """
     for plugin in plugins.iter_installed():
-        if isinstance(plugin.command, click.Command):
-            plugin.command.name = plugin.name
-            command_group.add_command(plugin.command)
+        add_plugin_command(command_group, plugin.name)
+
+
+def add_plugin_command(command_group: click.Group, name: str) -> None:
+    """
+    Add the command provided by the installed plugin with the given name, if any. Note
+    that this requires loading the plugin.
+    """
+    plugin = plugins.Plugins.installed_by_name().get(name)
+    if plugin is not None and isinstance(plugin.command, click.Command):
+        plugin.command.name = plugin.name
+        command_group.add_command(plugin.command)
 
 
 plugins_command.add_command(list_command)
@@ -1,4 +1,6 @@
 import os
+from copy import deepcopy
+from functools import lru_cache
 
 from . import env, exceptions, fmt, plugins, serialize, utils
 from .types import Config, cast_config
@@ -111,13 +113,10 @@ def get_base(config: Config) -> Config:
     # Load base values from plugins
     for plugin in plugins.iter_enabled(config):
         # Add new config key/values
-        for key, value in plugin.config_add.items():
-            new_key = plugin.config_key(key)
-            base[new_key] = value
+        base.update(plugin.config_add_prefixed)
 
         # Set existing config key/values
-        for key, value in plugin.config_set.items():
-            base[key] = value
+        base.update(plugin.config_set)
 
     return base
 
@@ -132,8 +131,7 @@ def get_defaults(config: Config) -> Config:
 
     for plugin in plugins.iter_enabled(config):
         # Create new defaults
-        for key, value in plugin.config_defaults.items():
-            defaults[plugin.config_key(key)] = value
+        defaults.update(plugin.config_defaults_prefixed)
 
     update_with_env(defaults)
     return defaults
@@ -143,8 +141,14 @@ def get_template(filename: str) -> Config:
     """
     Get one of the configuration templates.
 
-    Entries in this configuration are unrendered.
+    Entries in this configuration are unrendered. Templates are parsed only once: the
+    returned object is a copy, such that it can be safely modified.
     """
+    return deepcopy(parse_template(filename))
+
+
+@lru_cache(maxsize=None)
+def parse_template(filename: str) -> Config:
     config = serialize.load(env.read_template_file("config", filename))
     return cast_config(config)
 
@@ -167,8 +171,7 @@ def merge(config: Config, base: Config) -> None:
     configuration entries.
     """
     for key, value in base.items():
-        if key not in config:
-            config[key] = value
+        config.setdefault(key, value)
 
 
 def render_full(config: Config) -> None:
@@ -3,13 +3,14 @@ from copy import deepcopy
 from typing import Any, Iterable, List, Optional, Type, Union
 
 import jinja2
-import pkg_resources
 
 from . import exceptions, fmt, plugins, utils
 from .__about__ import __app__, __version__
 from .types import Config, ConfigValue
 
-TEMPLATES_ROOT = pkg_resources.resource_filename("tutor", "templates")
+# Templates are shipped as package data: don't import pkg_resources just to find them,
+# as it is very slow to import.
+TEMPLATES_ROOT = os.path.join(os.path.dirname(__file__), "templates")
 VERSION_FILENAME = "version"
 BIN_FILE_EXTENSIONS = [".ico", ".jpg", ".patch", ".png", ".ttf", ".woff", ".woff2"]
 
@@ -140,6 +141,9 @@ class Renderer:
             except exceptions.TutorError:
                 fmt.echo_error(f"Error rendering patch '{name}' from plugin {plugin}")
                 raise
+        if not patches:
+            # Most patches are not defined by any enabled plugin
+            return ""
         rendered = separator.join(patches)
         if rendered:
             rendered += suffix
@@ -1,16 +1,21 @@
+import bisect
 import importlib
+import json
 import os
-from copy import deepcopy
-from glob import glob
+import sys
+import tempfile
+from types import ModuleType, SimpleNamespace
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import appdirs
 import click
-import pkg_resources
 
 from . import exceptions, fmt, serialize
 from .__about__ import __app__
-from .types import Config, get_typed
+from .types import Config
+
+# Bound instance check, which is cheaper than isinstance when mapped over many values
+is_str = str.__instancecheck__
 
 CONFIG_KEY = "PLUGINS"
 
@@ -50,9 +55,33 @@ class BasePlugin:
     INSTALLED: List["BasePlugin"] = []
     _IS_LOADED = False
 
+    # There is one instance per installed plugin, and plugin attributes are accessed
+    # every time the configuration is loaded or a template is rendered.
+    __slots__ = (
+        "name",
+        "config_key_prefix",
+        "config",
+        "config_add_prefixed",
+        "config_defaults_prefixed",
+        "patches",
+        "hooks",
+        "templates_root",
+        "command",
+        "_version",
+    )
+
     def __init__(self, name: str, obj: Any) -> None:
-        self.name = name
+        # Plugin names are used as keys all over the place
+        self.name = sys.intern(name)
+        self.config_key_prefix = name.upper() + "_"
         self.config = self.load_config(obj, self.name)
+        # "add" and "defaults" keys are prefixed once, as they are read on every config load
+        self.config_add_prefixed: Config = {
+            self.config_key(key): value for key, value in self.config_add.items()
+        }
+        self.config_defaults_prefixed: Config = {
+            self.config_key(key): value for key, value in self.config_defaults.items()
+        }
         self.patches = self.load_patches(obj, self.name)
         self.hooks = self.load_hooks(obj, self.name)
 
@@ -76,20 +105,19 @@ class BasePlugin:
             raise exceptions.TutorError(
                 f"Invalid config in plugin {plugin_name}. Expected dict, got {config.__class__}."
             )
+        # Fast path: the detailed checks below are only required to report errors
+        if all(
+            is_str(name) and isinstance(subconfig, dict) and all(map(is_str, subconfig))
+            for name, subconfig in config.items()
+        ):
+            return config
+        check_config_keys(config, plugin_name)
         for name, subconfig in config.items():
-            if not isinstance(name, str):
-                raise exceptions.TutorError(
-                    f"Invalid config entry '{name}' in plugin {plugin_name}. Expected str, got {config.__class__}."
-                )
             if not isinstance(subconfig, dict):
                 raise exceptions.TutorError(
-                    f"Invalid config entry '{name}' in plugin {plugin_name}. Expected str keys, got {config.__class__}."
+                    f"Invalid config entry '{name}' in plugin {plugin_name}. Expected dict, got {subconfig.__class__}."
                 )
-            for key in subconfig.keys():
-                if not isinstance(key, str):
-                    raise exceptions.TutorError(
-                        f"Invalid config entry '{name}.{key}' in plugin {plugin_name}. Expected str, got {key.__class__}."
-                    )
+            check_config_keys(subconfig, plugin_name, prefix=f"{name}.")
         return config
 
     @staticmethod
@@ -102,6 +130,9 @@ class BasePlugin:
             raise exceptions.TutorError(
                 f"Invalid patches in plugin {plugin_name}. Expected dict, got {patches.__class__}."
             )
+        # Fast path: the detailed checks below are only required to report errors
+        if all(map(is_str, patches)) and all(map(is_str, patches.values())):
+            return patches
         for patch_name, content in patches.items():
             if not isinstance(patch_name, str):
                 raise exceptions.TutorError(
@@ -125,6 +156,19 @@ class BasePlugin:
             raise exceptions.TutorError(
                 f"Invalid hooks in plugin {plugin_name}. Expected dict, got {hooks.__class__}."
             )
+        # Fast path: the detailed checks below are only required to report errors
+        if all(
+            isinstance(hook_name, str)
+            and (
+                isinstance(hook, list)
+                and all(map(is_str, hook))
+                or isinstance(hook, dict)
+                and all(map(is_str, hook))
+                and all(map(is_str, hook.values()))
+            )
+            for hook_name, hook in hooks.items()
+        ):
+            return hooks
         for hook_name, hook in hooks.items():
             if not isinstance(hook_name, str):
                 raise exceptions.TutorError(
@@ -152,7 +196,7 @@ class BasePlugin:
         """
         Config keys in the "add" and "defaults" dicts should be prefixed by the plugin name, in uppercase.
         """
-        return self.name.upper() + "_" + key
+        return self.config_key_prefix + key
 
     @property
     def config_add(self) -> Config:
@@ -173,8 +217,7 @@ class BasePlugin:
     @classmethod
     def iter_installed(cls) -> Iterator["BasePlugin"]:
         if not cls._IS_LOADED:
-            for plugin in cls.iter_load():
-                cls.INSTALLED.append(plugin)
+            cls.INSTALLED.extend(cls.iter_load())
             cls._IS_LOADED = True
         yield from cls.INSTALLED
 
@@ -188,7 +231,48 @@ class BasePlugin:
         cls.INSTALLED.clear()
 
 
-class EntrypointPlugin(BasePlugin):
+class LazyPlugin(BasePlugin):
+    """
+    Lazy plugins load their underlying object only when one of the plugin attributes is
+    first accessed, such that discovering plugins does not slow down every CLI call.
+    Child classes should implement the `load_obj` method.
+    """
+
+    # Attributes that are only available after the plugin object is loaded
+    LAZY_ATTRIBUTES: Tuple[str, ...] = (
+        "config_key_prefix",
+        "config",
+        "config_add_prefixed",
+        "config_defaults_prefixed",
+        "patches",
+        "hooks",
+        "templates_root",
+        "command",
+    )
+
+    __slots__ = ()
+
+    def __init__(self, name: str):  # pylint: disable=super-init-not-called
+        self.name = sys.intern(name)
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr not in self.LAZY_ATTRIBUTES:
+            raise AttributeError(attr)
+        try:
+            super().__init__(self.name, self.load_obj())
+        except exceptions.TutorError as e:
+            # Plugins that fail to load are reported once, and then behave as empty
+            # plugins: otherwise, they would break every command, including the one that
+            # disables them.
+            fmt.echo_error(e.args[0])
+            super().__init__(self.name, None)
+        return getattr(self, attr)
+
+    def load_obj(self) -> Any:
+        raise NotImplementedError
+
+
+class EntrypointPlugin(LazyPlugin):
     """
     Entrypoint plugins are regular python packages that have a 'tutor.plugin.v0' entrypoint.
 
@@ -197,88 +281,136 @@ class EntrypointPlugin(BasePlugin):
     """
 
     ENTRYPOINT = "tutor.plugin.v0"
+    # Loaded plugin objects, indexed by entrypoint. Entrypoints are discovered again
+    # every time the plugin cache is cleared, but they only need to be loaded once.
+    LOADED_OBJECTS: Dict[Any, Any] = {}
+
+    __slots__ = ("entrypoint", "dist")
 
-    def __init__(self, entrypoint: pkg_resources.EntryPoint) -> None:
-        super().__init__(entrypoint.name, entrypoint.load())
+    def __init__(self, entrypoint: Any, dist: Any = None) -> None:
+        super().__init__(entrypoint.name)
         self.entrypoint = entrypoint
+        self.dist = dist
+        self._version: Optional[str] = None
+
+    def load_obj(self) -> Any:
+        if self.entrypoint not in self.LOADED_OBJECTS:
+            try:
+                self.LOADED_OBJECTS[self.entrypoint] = self.entrypoint.load()
+            except Exception as e:  # pylint: disable=broad-except
+                raise exceptions.TutorError(
+                    f"Failed to load entrypoint '{self.name}': {e}"
+                ) from e
+        return self.LOADED_OBJECTS[self.entrypoint]
 
     @property
     def version(self) -> str:
-        if not self.entrypoint.dist:
-            return "0.0.0"
-        return self.entrypoint.dist.version
+        # Reading the distribution version requires parsing its metadata, which is only
+        # useful when listing plugins.
+        if self._version is None:
+            self._version = self.dist.version if self.dist else "0.0.0"
+        return self._version
 
     @classmethod
     def iter_load(cls) -> Iterator["EntrypointPlugin"]:
-        for entrypoint in pkg_resources.iter_entry_points(cls.ENTRYPOINT):
-            try:
-                error: Optional[str] = None
-                yield cls(entrypoint)
-            except pkg_resources.VersionConflict as e:
-                error = e.report()
-            except Exception as e:  # pylint: disable=broad-except
-                error = str(e)
-            if error:
-                fmt.echo_error(
-                    f"Failed to load entrypoint '{entrypoint.name} = {entrypoint.module_name}' from distribution {entrypoint.dist}: {error}"
-                )
+        for entrypoint, dist in iter_entry_points(cls.ENTRYPOINT):
+            yield cls(entrypoint, dist)
 
 
-class OfficialPlugin(BasePlugin):
+class OfficialPlugin(LazyPlugin):
     """
     Official plugins have a "plugin" module which exposes a __version__ attribute.
     Official plugins should be manually added by calling `OfficialPlugin.load()`.
     """
 
+    LAZY_ATTRIBUTES = ("module",) + LazyPlugin.LAZY_ATTRIBUTES
+
+    __slots__ = ("module",)
+
     @classmethod
     def load(cls, name: str) -> BasePlugin:
         plugin = cls(name)
         cls.INSTALLED.append(plugin)
+        Plugins.reset_installed()
         return plugin
 
     def __init__(self, name: str):
-        self.module = importlib.import_module(f"tutor{name}.plugin")
-        super().__init__(name, self.module)
+        super().__init__(name)
+        self._version: Optional[str] = None
+
+    def load_obj(self) -> Any:
+        # The module remains None when the plugin fails to load
+        self.module: Optional[ModuleType] = None
+        try:
+            self.module = importlib.import_module(f"tutor{self.name}.plugin")
+        except ImportError as e:
+            raise exceptions.TutorError(
+                f"Failed to load plugin '{self.name}': {e}"
+            ) from e
+        return self.module
 
     @property
     def version(self) -> str:
-        version = getattr(self.module, "__version__")
-        if not isinstance(version, str):
-            raise TypeError("OfficialPlugin __version__ must be 'str'")
-        return version
+        if self._version is None:
+            if self.module is None:
+                return "0.0.0"
+            version = getattr(self.module, "__version__")
+            if not isinstance(version, str):
+                raise TypeError("OfficialPlugin __version__ must be 'str'")
+            self._version = version
+        return self._version
 
     @classmethod
     def iter_load(cls) -> Iterator[BasePlugin]:
         yield from []
 
 
-class DictPlugin(BasePlugin):
+class DictPlugin(LazyPlugin):
+    """
+    Dict plugins are defined in *.yml files stored in the plugins root.
+
+    Parsing all plugin files on every call is slow, so the name and version of each
+    plugin are stored in an index file in the plugins root. Plugins whose file did not
+    change since it was indexed are loaded lazily, when one of their attributes is first
+    accessed.
+    """
+
     ROOT_ENV_VAR_NAME = "TUTOR_PLUGINS_ROOT"
     ROOT = os.path.expanduser(
         os.environ.get(ROOT_ENV_VAR_NAME, "")
     ) or appdirs.user_data_dir(appname=__app__ + "-plugins")
+    INDEX_FILENAME = ".index.json"
 
-    def __init__(self, data: Config):
+    __slots__ = ("path",)
+
+    def __init__(self, data: Config, path: Optional[str] = None):
+        """
+        When a path is given, `data` only needs to include the plugin name and version:
+        the plugin file will be parsed on first access to one of the plugin attributes.
+        """
         name = data["name"]
         if not isinstance(name, str):
             raise exceptions.TutorError(
                 f"Invalid plugin name: '{name}'. Expected str, got {name.__class__}"
             )
-
-        # Create a generic object (sort of a named tuple) which will contain all key/values from data
-        class Module:
-            pass
-
-        obj = Module()
-        for key, value in data.items():
-            setattr(obj, key, value)
-
-        super().__init__(name, obj)
-
         version = data["version"]
         if not isinstance(version, str):
             raise TypeError("DictPlugin.__version__ must be str")
+
+        super().__init__(name)
         self._version: str = version
+        self.path = path
+        if path is None:
+            BasePlugin.__init__(self, name, self.load_namespace(data))
+
+    def load_obj(self) -> Any:
+        assert self.path is not None
+        return self.load_namespace(self.load_data(self.path))
+
+    @staticmethod
+    def load_namespace(data: Config) -> SimpleNamespace:
+        # Create a generic object (sort of a named tuple) which will contain all key/values from data
+        return SimpleNamespace(**data)
 
     @property
     def version(self) -> str:
@@ -286,19 +418,109 @@ class DictPlugin(BasePlugin):
 
     @classmethod
     def iter_load(cls) -> Iterator[BasePlugin]:
-        for path in glob(os.path.join(cls.ROOT, "*.yml")):
-            with open(path, encoding="utf-8") as f:
-                data = serialize.load(f)
-                if not isinstance(data, dict):
-                    raise exceptions.TutorError(
-                        f"Invalid plugin: {path}. Expected dict."
-                    )
-                try:
-                    yield cls(data)
-                except KeyError as e:
-                    raise exceptions.TutorError(
-                        f"Invalid plugin: {path}. Missing key: {e.args[0]}"
-                    )
+        index = cls.load_index()
+        updated_index: Dict[str, List[Any]] = {}
+        for entry in cls.list_entries():
+            stat = entry.stat()
+            indexed = index.get(entry.name)
+            if (
+                isinstance(indexed, list)
+                and len(indexed) == 4
+                and indexed[:2] == [stat.st_mtime_ns, stat.st_size]
+            ):
+                updated_index[entry.name] = indexed
+                yield cls({"name": indexed[2], "version": indexed[3]}, path=entry.path)
+            else:
+                plugin = cls.load_path(entry.path)
+                updated_index[entry.name] = [
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    plugin.name,
+                    plugin.version,
+                ]
+                yield plugin
+
+        if updated_index != index:
+            cls.save_index(updated_index)
+
+    @classmethod
+    def list_entries(cls) -> List["os.DirEntry[str]"]:
+        """
+        Return the *.yml plugin files from the plugins root. Hidden files are ignored.
+        """
+        try:
+            with os.scandir(cls.ROOT) as entries:
+                return [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(".yml")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+    @classmethod
+    def load_index(cls) -> Dict[str, List[Any]]:
+        """
+        The index has the following structure:
+        {filename -> [mtime_ns, size, plugin_name, plugin_version]}
+        A missing or corrupted index is simply rebuilt.
+        """
+        try:
+            with open(
+                os.path.join(cls.ROOT, cls.INDEX_FILENAME), encoding="utf-8"
+            ) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    @classmethod
+    def save_index(cls, index: Dict[str, List[Any]]) -> None:
+        try:
+            # Write to a uniquely named temporary file first, such that concurrent calls
+            # never read or write a partial index.
+            f = tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=cls.ROOT,
+                prefix=cls.INDEX_FILENAME,
+                suffix=".tmp",
+                delete=False,
+            )
+            try:
+                with f:
+                    json.dump(index, f)
+                # Temporary files are created with 0600 permissions: apply the umask
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(f.name, 0o666 & ~umask)
+                os.replace(f.name, os.path.join(cls.ROOT, cls.INDEX_FILENAME))
+            except BaseException:
+                os.remove(f.name)
+                raise
+        except OSError:
+            # The plugins root might be read-only: plugins will just be parsed again
+            pass
+
+    @classmethod
+    def load_path(cls, path: str) -> "DictPlugin":
+        data = cls.load_data(path)
+        try:
+            return cls(data)
+        except KeyError as e:
+            raise exceptions.TutorError(
+                f"Invalid plugin: {path}. Missing key: {e.args[0]}"
+            )
+
+    @staticmethod
+    def load_data(path: str) -> Config:
+        with open(path, encoding="utf-8") as f:
+            data = serialize.load(f)
+        if not isinstance(data, dict):
+            raise exceptions.TutorError(f"Invalid plugin: {path}. Expected dict.")
+        return data
 
 
 class Plugins:
@@ -307,29 +529,73 @@ class Plugins:
         EntrypointPlugin,
         DictPlugin,
     ]
+    # Sorted list of installed plugins, and the same plugins indexed by name. They are
+    # computed on first access and reset by `clear_cache`.
+    INSTALLED: Optional[List[BasePlugin]] = None
+    INSTALLED_BY_NAME: Optional[Dict[str, BasePlugin]] = None
+    # Patches and hooks of enabled plugins, indexed by the tuple of enabled plugin names.
+    # A new Plugins object is created for every patch and hook lookup, so the indexes
+    # are shared between all of them.
+    PATCHES: Dict[Tuple[str, ...], Dict[str, Tuple[Tuple[str, str], ...]]] = {}
+    HOOKS: Dict[
+        Tuple[str, ...],
+        Dict[str, Tuple[Tuple[str, Union[Dict[str, str], List[str]]], ...]],
+    ] = {}
+
+    # A new Plugins object is created for every patch and hook lookup
+    __slots__ = ("config", "template_roots")
 
     def __init__(self, config: Config):
-        self.config = deepcopy(config)
-        # patches has the following structure:
-        # {patch_name -> {plugin_name -> "content"}}
-        self.patches: Dict[str, Dict[str, str]] = {}
-        # some hooks have a dict-like structure, like "build", others are list of services.
-        self.hooks: Dict[str, Dict[str, Union[Dict[str, str], List[str]]]] = {}
+        # Only the list of enabled plugins is needed: don't copy the full configuration,
+        # which is large, but make sure that the original is never modified.
+        self.config: Config = {CONFIG_KEY: config.get(CONFIG_KEY)}
         self.template_roots: Dict[str, str] = {}
 
-        for plugin in self.iter_enabled():
-            for patch_name, content in plugin.patches.items():
-                if patch_name not in self.patches:
-                    self.patches[patch_name] = {}
-                self.patches[patch_name][plugin.name] = content
+    @property
+    def patches(self) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+        """
+        Patches have the following structure: {patch_name -> ((plugin_name, "content"), ...)}
+        Plugins are sorted by name, such that patches can be rendered without any copy.
+        """
+        key = tuple(enabled_plugins(self.config))
+        patches = self.PATCHES.get(key)
+        if patches is None:
+            plugin_patches: Dict[str, Dict[str, str]] = {}
+            for plugin in self.iter_enabled():
+                plugin_name = plugin.name
+                for patch_name, content in plugin.patches.items():
+                    plugin_patches.setdefault(patch_name, {})[plugin_name] = content
+            patches = self.PATCHES[key] = {
+                patch_name: tuple(sorted(contents.items()))
+                for patch_name, contents in plugin_patches.items()
+            }
+        return patches
 
-            for hook_name, services in plugin.hooks.items():
-                if hook_name not in self.hooks:
-                    self.hooks[hook_name] = {}
-                self.hooks[hook_name][plugin.name] = services
+    @property
+    def hooks(
+        self,
+    ) -> Dict[str, Tuple[Tuple[str, Union[Dict[str, str], List[str]]], ...]]:
+        """
+        Hooks have the following structure: {hook_name -> ((plugin_name, hook), ...)}
+        Some hooks have a dict-like structure, like "build", others are list of services.
+        """
+        key = tuple(enabled_plugins(self.config))
+        hooks = self.HOOKS.get(key)
+        if hooks is None:
+            plugin_hooks: Dict[str, Dict[str, Union[Dict[str, str], List[str]]]] = {}
+            for plugin in self.iter_enabled():
+                plugin_name = plugin.name
+                for hook_name, services in plugin.hooks.items():
+                    plugin_hooks.setdefault(hook_name, {})[plugin_name] = services
+            hooks = self.HOOKS[key] = {
+                hook_name: tuple(services.items())
+                for hook_name, services in plugin_hooks.items()
+            }
+        return hooks
 
     @classmethod
     def clear_cache(cls) -> None:
+        cls.reset_installed()
         for PluginClass in cls.PLUGIN_CLASSES:
             PluginClass.clear_cache()
 
@@ -339,47 +605,100 @@ class Plugins:
         Iterate on all installed plugins. Plugins are deduplicated by name. The list of installed plugins is cached to
         prevent too many re-computations, which happens a lot.
         """
-        installed_plugin_names = set()
-        plugins = []
-        for PluginClass in cls.PLUGIN_CLASSES:
-            for plugin in PluginClass.iter_installed():
-                if plugin.name not in installed_plugin_names:
-                    installed_plugin_names.add(plugin.name)
-                    plugins.append(plugin)
-        plugins = sorted(plugins, key=lambda plugin: plugin.name)
-        yield from plugins
+        yield from cls.load_installed()
+
+    @classmethod
+    def reset_installed(cls) -> None:
+        cls.INSTALLED = None
+        cls.INSTALLED_BY_NAME = None
+        cls.PATCHES.clear()
+        cls.HOOKS.clear()
+
+    @classmethod
+    def installed_by_name(cls) -> Dict[str, BasePlugin]:
+        installed_by_name = cls.INSTALLED_BY_NAME
+        if installed_by_name is None:
+            installed_by_name = cls.INSTALLED_BY_NAME = {
+                plugin.name: plugin for plugin in cls.iter_installed()
+            }
+        return installed_by_name
+
+    @classmethod
+    def load_installed(cls) -> List[BasePlugin]:
+        installed = cls.INSTALLED
+        if installed is None:
+            installed_plugin_names = set()
+            plugins = []
+            for PluginClass in cls.PLUGIN_CLASSES:
+                for plugin in PluginClass.iter_installed():
+                    if plugin.name not in installed_plugin_names:
+                        installed_plugin_names.add(plugin.name)
+                        plugins.append(plugin)
+            installed = cls.INSTALLED = sorted(plugins, key=lambda plugin: plugin.name)
+        return installed
 
     def iter_enabled(self) -> Iterator[BasePlugin]:
+        enabled = set(enabled_plugins(self.config))
+        if not enabled:
+            # Don't even load the installed plugins
+            return
         for plugin in self.iter_installed():
-            if is_enabled(self.config, plugin.name):
+            if plugin.name in enabled:
                 yield plugin
 
     def iter_patches(self, name: str) -> Iterator[Tuple[str, str]]:
-        plugin_patches = self.patches.get(name, {})
-        plugins = sorted(plugin_patches.keys())
-        for plugin in plugins:
-            yield plugin, plugin_patches[plugin]
+        yield from self.patches.get(name, ())
 
     def iter_hooks(
         self, hook_name: str
     ) -> Iterator[Tuple[str, Union[Dict[str, str], List[str]]]]:
-        yield from self.hooks.get(hook_name, {}).items()
+        yield from self.hooks.get(hook_name, ())
+
+
+def check_config_keys(
+    config: Dict[Any, Any], plugin_name: str, prefix: str = ""
+) -> None:
+    for key in config:
+        if not isinstance(key, str):
+            raise exceptions.TutorError(
+                f"Invalid config entry '{prefix}{key}' in plugin {plugin_name}. Expected str, got {key.__class__}."
+            )
 
 
 def get_callable_attr(
     plugin: Any, attr_name: str, default: Optional[Any] = None
 ) -> Optional[Any]:
     attr = getattr(plugin, attr_name, default)
-    if callable(attr):
+    # Most plugins define plain data attributes, which are never callable
+    if type(attr) not in (dict, str, list) and callable(attr):
         attr = attr()
     return attr
 
 
+def iter_entry_points(group: str) -> Iterator[Tuple[Any, Any]]:
+    """
+    Iterate on the (entrypoint, distribution) tuples of the given entrypoint group. The
+    distribution might be None.
+
+    importlib.metadata is much faster than pkg_resources, which scans and validates all
+    installed distributions on import, but it is only available in python >= 3.8.
+    """
+    try:
+        from importlib import metadata  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        import pkg_resources  # pylint: disable=import-outside-toplevel
+
+        for entrypoint in pkg_resources.iter_entry_points(group):
+            yield entrypoint, entrypoint.dist
+        return
+    for dist in metadata.distributions():
+        for entrypoint in dist.entry_points:
+            if entrypoint.group == group:
+                yield entrypoint, dist
+
+
 def is_installed(name: str) -> bool:
-    for plugin in iter_installed():
-        if name == plugin.name:
-            return True
-    return False
+    return name in Plugins.installed_by_name()
 
 
 def iter_installed() -> Iterator[BasePlugin]:
@@ -392,26 +711,29 @@ def enable(config: Config, name: str) -> None:
     if is_enabled(config, name):
         return
     enabled = enabled_plugins(config)
-    enabled.append(name)
-    enabled.sort()
+    # The list of enabled plugins is kept sorted, unless it was edited by hand
+    if all(left <= right for left, right in zip(enabled, enabled[1:])):
+        bisect.insort(enabled, name)
+    else:
+        enabled.append(name)
+        enabled.sort()
 
 
 def disable(config: Config, plugin: BasePlugin) -> None:
     # Remove plugin-specific set config
-    for key in plugin.config_set.keys():
-        config.pop(key, None)
+    for key in plugin.config_set.keys() & config.keys():
+        del config[key]
 
     # Remove plugin from list of enabled plugins
     enabled = enabled_plugins(config)
-    while plugin.name in enabled:
-        enabled.remove(plugin.name)
+    enabled[:] = [name for name in enabled if name != plugin.name]
 
 
 def get_enabled(config: Config, name: str) -> BasePlugin:
-    for plugin in iter_enabled(config):
-        if plugin.name == name:
-            return plugin
-    raise ValueError(f"Enabled plugin {name} could not be found.")
+    plugin = Plugins.installed_by_name().get(name)
+    if plugin is None or not is_enabled(config, name):
+        raise ValueError(f"Enabled plugin {name} could not be found.")
+    return plugin
 
 
 def iter_enabled(config: Config) -> Iterator[BasePlugin]:
@@ -423,9 +745,13 @@ def is_enabled(config: Config, name: str) -> bool:
 
 
 def enabled_plugins(config: Config) -> List[str]:
-    if not config.get(CONFIG_KEY):
-        config[CONFIG_KEY] = []
-    plugins = get_typed(config, CONFIG_KEY, list)
+    plugins = config.get(CONFIG_KEY)
+    if not plugins:
+        plugins = config[CONFIG_KEY] = []
+    if not isinstance(plugins, list):
+        raise exceptions.TutorError(
+            f"Invalid config entry: expected list, got {plugins.__class__} for key '{CONFIG_KEY}'"
+        )
     return plugins
 
 
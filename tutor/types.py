@@ -13,6 +13,10 @@ def cast_config(config: Any) -> Config:
         raise exceptions.TutorError(
             "Invalid configuration: expected dict, got {}".format(config.__class__)
         )
+    # Fast path: keys are checked in a single C loop, and the invalid key is only
+    # looked up to report the error.
+    if all(map(str.__instancecheck__, config)):
+        return config
     for key in config.keys():
         if not isinstance(key, str):
             raise exceptions.TutorError(